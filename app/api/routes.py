@@ -1,20 +1,132 @@
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
+import logging
 import os
 import uuid
 from pathlib import Path
-from datetime import datetime
+import time
 
-from app.models.schemas import VideoSignRequest, SigningResponse, ErrorResponse
-from app.core.config import settings
+from app.api.responses import IMMUTABLE_CACHE_CONTROL, AccelRedirectResponse, VideoFileResponse
+from app.models.schemas import SigningResponse
+from app.core.config import VIDEO_EXTENSIONS, settings
 from app.services.c2pa_service import c2pa_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
-def get_file_size_mb(file_path: str) -> float:
-    """Get file size in megabytes"""
-    return os.path.getsize(file_path) / (1024 * 1024)
+# Read uploads in fixed-size chunks so memory stays flat regardless of file size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Accepted upload types, checked once per request with O(1) lookup
+_ALLOWED_EXTENSIONS_LABEL = ', '.join(sorted(VIDEO_EXTENSIONS))
+
+# Resolved once at import; downloads must resolve to a path inside it
+_UPLOAD_ROOT = Path(settings.UPLOAD_DIR).resolve()
+
+# Absolute upload directory, so paths handed to the service need no getcwd()
+_UPLOAD_DIR_ABS = str(_UPLOAD_ROOT)
+
+def _copy_upload_in_kernel(source, dest_path: str, max_bytes: int) -> Optional[int]:
+    """
+    Copy an upload that Starlette already spooled to disk without reading it
+    into Python, using copy_file_range(2)
+
+    The spool file is an anonymous temporary file (usually on another
+    filesystem), so it cannot simply be renamed into place.
+
+    Returns:
+        Size of the upload, or None when the kernel copy is not available
+    """
+    if not getattr(source, "_rolled", False) or not hasattr(os, "copy_file_range"):
+        return None
+
+    src_fd = source.fileno()
+    offset = source.tell()
+    size = os.fstat(src_fd).st_size - offset
+    if size > max_bytes:
+        return size
+
+    try:
+        with open(dest_path, "wb") as buffer:
+            dst_fd = buffer.fileno()
+            copied = 0
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied, offset + copied)
+                if n == 0:
+                    break
+                copied += n
+    except OSError:
+        # e.g. EXDEV on kernels older than 5.3; fall back to a buffered copy
+        return None
+
+    return copied
+
+def _copy_upload(source, dest_path: str, max_bytes: int) -> int:
+    """
+    Copy an upload into dest_path through one reusable buffer
+
+    Stops as soon as more than max_bytes have been read.
+
+    Returns:
+        Number of bytes read from the upload
+    """
+    # Still held in memory by the spooled file: write it out in one call
+    if getattr(source, "_rolled", None) is False:
+        offset = source.tell()
+        with source._file.getbuffer() as data:
+            size = len(data) - offset
+            if size > max_bytes:
+                return size
+            with open(dest_path, "wb") as buffer:
+                buffer.write(data[offset:])
+        return size
+
+    copied = _copy_upload_in_kernel(source, dest_path, max_bytes)
+    if copied is not None:
+        return copied
+
+    buf = bytearray(UPLOAD_CHUNK_SIZE)
+    view = memoryview(buf)
+    # SpooledTemporaryFile only grew readinto() in Python 3.11
+    readinto = getattr(source, "readinto", None) or source._file.readinto
+    written = 0
+
+    with open(dest_path, "wb") as buffer:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(buffer.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while n := readinto(buf):
+            written += n
+            if written > max_bytes:
+                break
+            buffer.write(view[:n])
+
+    return written
+
+async def save_upload(video: UploadFile, dest_path: str) -> int:
+    """
+    Stream an uploaded file to disk, enforcing the size limit as bytes arrive
+
+    Args:
+        video: Uploaded file
+        dest_path: Path where the upload will be written
+
+    Returns:
+        Number of bytes written
+    """
+    max_bytes = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+    written = await run_in_threadpool(_copy_upload, video.file, dest_path, max_bytes)
+
+    if written > max_bytes:
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE_MB}MB"
+        )
+
+    return written
 
 @router.post(
     "/sign-video",
@@ -29,7 +141,7 @@ def get_file_size_mb(file_path: str) -> float:
                     "example": {
                         "status": "ok",
                         "message": "C2PA signing succeeded in embedded mode.",
-                        "job_id": "550e8400-e29b-41d4-a716-446655440000",
+                        "job_id": "550e8400e29b41d4a716446655440000",
                         "links": {
                             "download_url": "http://localhost:8000/files/video-signed-20231113.mp4",
                             "manifest_url": "http://localhost:8000/files/video-signed-20231113.manifest.json",
@@ -44,7 +156,8 @@ def get_file_size_mb(file_path: str) -> float:
                 }
             }
         },
-        400: {"description": "Invalid request - bad file type or size"},
+        400: {"description": "Invalid request - bad file type"},
+        413: {"description": "File exceeds the maximum upload size"},
         500: {"description": "Server error during signing"}
     }
 )
@@ -108,87 +221,62 @@ async def sign_video(
     """
     
     # Validate file type
-    allowed_extensions = ['.mp4', '.mov', '.m4v']
-    file_ext = Path(video.filename).suffix.lower()
+    file_ext = os.path.splitext(video.filename)[1].lower()
     
-    if file_ext not in allowed_extensions:
+    if file_ext not in VIDEO_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type '{file_ext}'. Allowed types: {', '.join(allowed_extensions)}"
+            detail=f"Invalid file type '{file_ext}'. Allowed types: {_ALLOWED_EXTENSIONS_LABEL}"
         )
     
     # Generate unique job ID and filenames
-    job_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    job_id = uuid.uuid4().hex
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
     base_filename = f"video-signed-{timestamp}-{job_id[:8]}"
     
     # File paths
-    input_path = os.path.join(settings.UPLOAD_DIR, f"temp_{job_id}{file_ext}")
-    output_path = os.path.join(settings.UPLOAD_DIR, f"{base_filename}{file_ext}")
-    output_manifest_path = os.path.join(settings.UPLOAD_DIR, f"{base_filename}.manifest.json")
-    manifest_path = None
+    input_path = os.path.join(_UPLOAD_DIR_ABS, f"temp_{job_id}{file_ext}")
+    output_path = os.path.join(_UPLOAD_DIR_ABS, f"{base_filename}{file_ext}")
+    output_manifest_path = os.path.join(_UPLOAD_DIR_ABS, f"{base_filename}.manifest.json")
     
     try:
         # Save uploaded file
-        print(f"📤 Uploading video: {video.filename}")
-        with open(input_path, "wb") as buffer:
-            content = await video.read()
-            buffer.write(content)
-        
-        file_size_mb = get_file_size_mb(input_path)
-        print(f"📊 File size: {file_size_mb:.2f} MB")
-        
-        # Check file size limit
-        if file_size_mb > settings.MAX_FILE_SIZE_MB:
-            os.remove(input_path)
-            raise HTTPException(
-                status_code=400,
-                detail=f"File too large ({file_size_mb:.1f}MB). Maximum size: {settings.MAX_FILE_SIZE_MB}MB"
-            )
+        logger.info("Uploading video: %s", video.filename)
+        file_size_mb = await save_upload(video, input_path) / (1024 * 1024)
+        logger.info("File size: %.2f MB", file_size_mb)
         
         # Generate manifest
-        print(f"📝 Generating C2PA manifest...")
-        manifest_path = c2pa_service.generate_manifest(
+        logger.info("Generating C2PA manifest")
+        manifest = c2pa_service.generate_manifest(
             organization=organization,
             ai_tool=ai_tool,
             title=title,
             description=description
         )
-        print(f"✅ Manifest created: {manifest_path}")
         
         # Sign the video
-        print(f"🔐 Signing video with C2PA credentials...")
-        result = c2pa_service.sign_video(
+        logger.info("Signing video with C2PA credentials")
+        result = await c2pa_service.sign_video(
             input_video_path=input_path,
             output_video_path=output_path,
-            manifest_path=manifest_path
+            manifest=manifest,
+            output_manifest_path=output_manifest_path
         )
         
-        if not result['success']:
-            raise Exception(result.get('error', 'Signing failed'))
+        if not result.success:
+            raise Exception(result.error or 'Signing failed')
         
-        print(f"✅ Video signed successfully")
-        
-        # Extract manifest to separate JSON file
-        print(f"📄 Extracting manifest to JSON...")
-        manifest_extracted = c2pa_service.extract_manifest(
-            output_path, 
-            output_manifest_path
-        )
+        logger.info("Video signed successfully")
         
+        manifest_extracted = result.manifest_path is not None
         if manifest_extracted:
-            print(f"✅ Manifest extracted: {output_manifest_path}")
+            logger.info("Manifest extracted: %s", output_manifest_path)
         else:
-            print(f"⚠️  Warning: Could not extract manifest to separate file")
+            logger.warning("Could not extract manifest to separate file")
         
         # Clean up temporary files
-        print(f"🧹 Cleaning up temporary files...")
         if os.path.exists(input_path):
             os.remove(input_path)
-        if manifest_path and os.path.exists(manifest_path):
-            os.remove(manifest_path)
-        
-        print(f"✅ Process complete!")
         
         # Build response
         base_url = f"http://{settings.HOST}:{settings.PORT}"
@@ -206,7 +294,7 @@ async def sign_video(
             metadata={
                 "original_filename": video.filename,
                 "file_size_mb": round(file_size_mb, 2),
-                "signed_at": datetime.utcnow().isoformat() + "Z",
+                "signed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
                 "organization": organization,
                 "ai_tool": ai_tool,
                 "title": title,
@@ -218,8 +306,8 @@ async def sign_video(
         raise
     except Exception as e:
         # Clean up on error
-        print(f"❌ Error: {str(e)}")
-        for path in [input_path, output_path, manifest_path, output_manifest_path]:
+        logger.error("Error signing video: %s", e)
+        for path in [input_path, output_path, output_manifest_path]:
             if path and os.path.exists(path):
                 try:
                     os.remove(path)
@@ -232,9 +320,10 @@ async def sign_video(
     "/files/{filename}",
     summary="Download signed video or manifest",
     description="Download a signed video file or its manifest JSON",
-    response_class=FileResponse,
+    response_class=VideoFileResponse,
     responses={
         200: {"description": "File download successful"},
+        400: {"description": "Invalid filename"},
         404: {"description": "File not found"},
         403: {"description": "Access denied"}
     }
@@ -251,20 +340,25 @@ async def download_file(filename: str):
     GET /api/v1/files/video-signed-20231113-abc123.mp4
 ```
     """
-    file_path = os.path.join(settings.UPLOAD_DIR, filename)
+    if "/" in filename or "\\" in filename or "\x00" in filename:
+        raise HTTPException(status_code=400, detail="Invalid filename")
     
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="File not found")
+    # Security: Prevent directory traversal attacks, including symlink escapes
+    file_path = (_UPLOAD_ROOT / filename).resolve()
+    try:
+        file_path.relative_to(_UPLOAD_ROOT)
+    except ValueError:
+        raise HTTPException(status_code=403, detail="Access denied")
     
-    # Security: Prevent directory traversal attacks
-    real_path = os.path.abspath(file_path)
-    allowed_dir = os.path.abspath(settings.UPLOAD_DIR)
+    if not file_path.is_file():
+        raise HTTPException(status_code=404, detail="File not found")
     
-    if not real_path.startswith(allowed_dir):
-        raise HTTPException(status_code=403, detail="Access denied")
+    if settings.ACCEL_REDIRECT_PREFIX:
+        return AccelRedirectResponse(settings.ACCEL_REDIRECT_PREFIX, filename)
     
-    return FileResponse(
+    return VideoFileResponse(
         path=file_path,
         filename=filename,
-        media_type='application/octet-stream'
+        media_type='application/octet-stream',
+        headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL}
     )
\ No newline at end of file
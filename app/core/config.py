@@ -1,7 +1,11 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import List, Optional
 import os
 
+# Video containers the service accepts for upload and serves for download
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.m4v'})
+
 class Settings(BaseSettings):
     """Application settings and configuration"""
     
@@ -9,17 +13,41 @@ class Settings(BaseSettings):
     APP_NAME: str = "C2PA Video Signing Service"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
+    PRODUCTION: bool = False
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    WORKERS: int = (os.cpu_count() or 1) * 2 + 1
+    THREADPOOL_SIZE: int = 40
+    TIMEOUT_KEEP_ALIVE: int = 30
+    LIMIT_CONCURRENCY: Optional[int] = None
+    LIMIT_MAX_REQUESTS: Optional[int] = 10000
+    ALLOWED_HOSTS: List[str] = ["*"]
+    
+    # CORS related (lists are JSON in the environment, e.g. '["https://a.example"]')
+    CORS_ORIGINS: List[str] = ["*"]
+    CORS_METHODS: List[str] = ["GET", "POST"]
+    CORS_HEADERS: List[str] = ["Authorization", "Content-Type", "Range"]
+    # Credentials need concrete CORS_ORIGINS; with "*" Starlette has to echo
+    # each request's Origin back
+    CORS_ALLOW_CREDENTIALS: bool = False
     
     # File Storage related
     UPLOAD_DIR: str = "./files"
     MAX_FILE_SIZE_MB: int = 500
+    SPOOL_MAX_MB: int = 32
+    ACCEL_REDIRECT_PREFIX: str = ""
+    STATIC_CACHE_MB: int = 64
     
     # C2PA related
-    CERT_PATH: str = "./certificates/rsa_certificate.pem"
-    PRIVATE_KEY_PATH: str = "./certificates/rsa_private_key.pem"
+    CERT_PATH: str = "./certificates/sign-cert.pem"
+    PRIVATE_KEY_PATH: str = "./certificates/sign-key.pem"
     MANIFEST_DIR: str = "./manifests"
+    USE_C2PA_SDK: bool = True
+    # Per worker process; unset splits half the cores across the workers,
+    # which is 1 with the default WORKERS
+    MAX_CONCURRENT_SIGNINGS: Optional[int] = None
+    SIGNING_ALG: str = "es256"
+    TIMESTAMP_URL: str = "http://timestamp.digicert.com"
     
     class Config:
         env_file = ".env"
@@ -30,9 +58,4 @@ def get_settings():
     """Get cached settings instance"""
     return Settings()
 
-settings = get_settings()
-
-# Ensure necessary directories exist on startup
-os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-os.makedirs(settings.MANIFEST_DIR, exist_ok=True)
-os.makedirs(os.path.dirname(settings.CERT_PATH), exist_ok=True)
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
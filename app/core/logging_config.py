@@ -0,0 +1,22 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+from app.core.config import settings
+
+# Configured on import, so main.py imports this module before anything that
+# logs at import time (the signing service logs its backend when created).
+# Request handlers only enqueue formatted records; a listener thread
+# does the stderr writes
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+logging.getLogger("app").setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
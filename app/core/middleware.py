@@ -0,0 +1,140 @@
+import logging
+import time
+from typing import Optional
+
+import orjson
+from starlette.exceptions import HTTPException
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import VIDEO_EXTENSIONS, settings
+
+# Headroom for multipart boundaries and the metadata form fields
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Download suffixes that are already compressed video containers
+VIDEO_SUFFIXES = tuple(VIDEO_EXTENSIONS)
+
+access_logger = logging.getLogger("app.access")
+
+
+class MaxBodySizeMiddleware:
+    """
+    Reject request bodies larger than the upload limit
+
+    FastAPI parses (and spools) the whole multipart body before the route
+    handler runs, so an oversized upload has to be turned away here. A
+    declared Content-Length over the limit is rejected before any of the body
+    is read; chunked bodies, or ones that outgrow their header, are counted
+    as they arrive and cut off with a 413 once they pass the limit.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: Optional[int] = None):
+        self.app = app
+        if max_body_bytes is None:
+            max_body_bytes = settings.MAX_FILE_SIZE_MB * 1024 * 1024 + MULTIPART_OVERHEAD_BYTES
+        self.max_body_bytes = max_body_bytes
+        self.detail = f"File too large. Maximum size: {settings.MAX_FILE_SIZE_MB}MB"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_body_bytes:
+                    response = JSONResponse(status_code=413, content={"detail": self.detail})
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # FastAPI re-raises HTTPExceptions from body parsing,
+                    # so its exception handler answers with the 413
+                    raise HTTPException(status_code=413, detail=self.detail)
+            return message
+
+        async def send_with_state(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, send_with_state)
+        except HTTPException as e:
+            # Apps without an exception handler let it reach us
+            if e.status_code != 413 or response_started:
+                raise
+            response = JSONResponse(status_code=413, content={"detail": self.detail})
+            await response(scope, receive, send)
+
+
+class VideoAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZip responses, except video downloads
+
+    Starlette only skips compression when a response already has a
+    Content-Encoding, so streamed video files would be run through gzip
+    chunk by chunk for no size gain. Those paths bypass the compressor;
+    JSON and manifest sidecars are still compressed.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].lower().endswith(VIDEO_SUFFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        await super().__call__(scope, receive, send)
+
+
+class AccessLogMiddleware:
+    """
+    Log one JSON line per HTTP request, replacing uvicorn's access log
+
+    The request is timed with perf_counter_ns and the line is encoded with
+    orjson. The record goes through the queue-based logging setup, so the
+    stderr write happens on the listener thread, not the event loop.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not access_logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter_ns()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            client = scope.get("client")
+            access_logger.info(
+                "%s",
+                orjson.dumps({
+                    "client": client[0] if client else None,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": round((time.perf_counter_ns() - start) / 1_000_000, 3)
+                }).decode()
+            )
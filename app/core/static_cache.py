@@ -0,0 +1,96 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import settings
+
+# Only files up to this size are kept in memory; larger ones are streamed
+MAX_ENTRY_BYTES = 1024 * 1024
+
+
+class StaticFileCache:
+    """
+    Byte-bounded LRU cache of small file contents
+
+    Entries are keyed by path and tagged with the file's mtime and size.
+    Callers pass the stat result they already have, so a hit costs no I/O
+    and a rewritten file is simply read again.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int = MAX_ENTRY_BYTES):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def cacheable(self, stat_result: os.stat_result) -> bool:
+        return stat_result.st_size <= self.max_entry_bytes
+
+    def peek(self, path: str, stat_result: os.stat_result) -> Optional[bytes]:
+        """
+        Return the cached contents of path without touching the disk
+
+        Args:
+            path: File path, used as the cache key
+            stat_result: Current stat of the file
+
+        Returns:
+            File bytes, or None on a miss or a stale entry
+        """
+
+        version = (stat_result.st_mtime_ns, stat_result.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(path)
+                return entry[1]
+        return None
+
+    def get(self, path: str, stat_result: os.stat_result) -> Optional[bytes]:
+        """
+        Return the contents of path, reading it on a miss
+
+        This does blocking file I/O on a miss; call it from a worker thread.
+
+        Args:
+            path: File path, used as the cache key
+            stat_result: Current stat of the file
+
+        Returns:
+            File bytes, or None when the file is too large to cache
+        """
+
+        if not self.cacheable(stat_result):
+            return None
+
+        data = self.peek(path, stat_result)
+        if data is not None:
+            return data
+
+        version = (stat_result.st_mtime_ns, stat_result.st_size)
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        # A file that changed while being read is served but not cached
+        if len(data) == stat_result.st_size:
+            self._store(path, version, data)
+        return data
+
+    def _store(self, path: str, version: Tuple[int, int], data: bytes) -> None:
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._size -= len(old[1])
+
+            self._entries[path] = (version, data)
+            self._size += len(data)
+
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+# Create singleton instance
+static_file_cache = StaticFileCache(settings.STATIC_CACHE_MB * 1024 * 1024)
@@ -1,15 +1,84 @@
-import json
+import asyncio
+import concurrent.futures
+import functools
+import io
+import logging
 import subprocess
 import os
-import uuid
+import shutil
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional
-from datetime import datetime
+import time
+import orjson
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+try:
+    import c2pa
+except ImportError:
+    # c2pa-python is not installed, fall back to the c2patool CLI
+    c2pa = None
+
+@functools.lru_cache(maxsize=None)
+def _require_file(path: str, label: str) -> None:
+    """Raise if path does not exist; successful checks are cached per process"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{label} not found at: {path}")
+
+@functools.lru_cache(maxsize=None)
+def _c2patool_version(c2patool: str) -> str:
+    """Return the c2patool version string; runs the binary at most once per process"""
+    result = subprocess.run(
+        [c2patool, "--version"],
+        capture_output=True,
+        check=True,
+        text=True
+    )
+    return result.stdout.strip()
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write data to path with raw os.write calls, bypassing Python's io layers"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+@dataclass(slots=True)
+class SignResult:
+    """Outcome of signing one video"""
+    success: bool
+    output_path: Optional[str] = None
+    message: Optional[str] = None
+    error: Optional[str] = None
+    manifest_path: Optional[str] = None
+    stdout: str = ""
+    stderr: str = ""
+
+def _check_signed_output(path: str) -> None:
+    """Raise unless path is a non-empty file; a single stat covers both checks"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise Exception("Signed video file was not created")
+    if st.st_size == 0:
+        raise Exception("Signed video file is empty")
+
 class C2PAService:
     """Service for handling C2PA signing operations"""
     
+    # Static manifest values, shared by every signing request. v2 claims only
+    # record claim_generator_info; the plain string is for c2patool builds
+    # that still write v1 claims
+    CLAIM_GENERATOR = f"{settings.APP_NAME}/{settings.APP_VERSION}"
+    DEFAULT_TITLE = "AI Generated Content Credentials"
+    DIGITAL_SOURCE_TYPE = "http://cv.iptc.org/newscodes/digitalsourcetype/trainedAlgorithmicMedia"
+    
     def __init__(self):
         # Initialize paths from settings first
         self.cert_path = settings.CERT_PATH
@@ -17,22 +86,108 @@ class C2PAService:
         self.manifest_dir = settings.MANIFEST_DIR
         
         # Verify certificates exist
-        if not os.path.exists(self.cert_path):
-            raise FileNotFoundError(f"Certificate not found at: {self.cert_path}")
-        if not os.path.exists(self.private_key_path):
-            raise FileNotFoundError(f"Private key not found at: {self.private_key_path}")
+        _require_file(self.cert_path, "Certificate")
+        _require_file(self.private_key_path, "Private key")
         
-        # Verify c2patool is installed
-        try:
-            result = subprocess.run(
-                ["c2patool", "--version"],
-                capture_output=True,
-                check=True,
-                text=True
+        # Signings admitted at once; later requests wait here instead of
+        # oversubscribing the CPU with c2patool processes or SDK threads.
+        # Every worker process has its own slots, so the default shares half
+        # the cores between them. With the default WORKERS (2 x cores + 1)
+        # that is always 1 per worker; it only grows when WORKERS is lowered
+        max_signings = settings.MAX_CONCURRENT_SIGNINGS
+        if max_signings is None:
+            workers = 1 if settings.DEBUG else settings.WORKERS
+            max_signings = max(1, (os.cpu_count() or 1) // 2 // workers)
+        self._max_signings = max_signings
+        self._sign_slots = asyncio.Semaphore(max_signings)
+        
+        # Dedicated workers for blocking signing work, separate from the
+        # loop's default executor; recreated by start() after a shutdown()
+        self._pool = self._new_pool()
+        
+        # Prefer the in-process c2pa SDK: load the signer once and reuse it
+        self._use_sdk = settings.USE_C2PA_SDK and c2pa is not None
+        if settings.USE_C2PA_SDK and c2pa is None:
+            logger.warning("c2pa-python is not installed, falling back to c2patool")
+        self._signer = None
+        self._c2patool = None
+        if self._use_sdk:
+            try:
+                self._signer = self._load_signer()
+                logger.info("c2pa SDK version: %s", c2pa.sdk_version())
+            except c2pa.C2paError as e:
+                message = (
+                    f"c2pa could not load the signing credentials from CERT_PATH={self.cert_path} "
+                    f"and PRIVATE_KEY_PATH={self.private_key_path} with SIGNING_ALG={settings.SIGNING_ALG}: {e}"
+                )
+                if not shutil.which("c2patool"):
+                    raise RuntimeError(message) from e
+                logger.error("%s; falling back to c2patool", message)
+                self._use_sdk = False
+        
+        if not self._use_sdk:
+            # Resolve c2patool once so each call skips the PATH lookup
+            self._c2patool = shutil.which("c2patool")
+            if not self._c2patool:
+                raise RuntimeError("c2patool is not installed or not in PATH")
+            
+            # c2patool runs from the certificates directory; resolve it once
+            self._cert_dir = os.path.dirname(os.path.abspath(self.cert_path))
+            
+            # Signer fields c2patool expects in every manifest; certificate
+            # paths are relative because c2patool runs from their directory
+            self._cli_signer_fields = {
+                "alg": settings.SIGNING_ALG,
+                "private_key": Path(self.private_key_path).name,
+                "sign_cert": Path(self.cert_path).name,
+                "ta_url": settings.TIMESTAMP_URL
+            }
+            
+            # Finding the binary is enough; only probe its version when debugging
+            if settings.DEBUG:
+                try:
+                    logger.info("c2patool version: %s", _c2patool_version(self._c2patool))
+                except (subprocess.CalledProcessError, OSError) as e:
+                    raise RuntimeError(f"c2patool could not be run: {e}")
+    
+    def _load_signer(self):
+        """Read the PEM files once and build the signer every SDK call reuses"""
+        with open(self.cert_path, 'rb') as f:
+            cert_pem = f.read()
+        with open(self.private_key_path, 'rb') as f:
+            key_pem = f.read()
+        return c2pa.Signer.from_info(
+            c2pa.C2paSignerInfo(
+                alg=settings.SIGNING_ALG,
+                sign_cert=cert_pem,
+                private_key=key_pem,
+                ta_url=settings.TIMESTAMP_URL or None
             )
-            print(f"✅ c2patool version: {result.stdout.strip()}")
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            raise RuntimeError(f"c2patool is not installed or not in PATH: {e}")
+        )
+    
+    def _new_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        # One thread per signing slot, so SDK reads and extractions share
+        # the same CPU budget as signing instead of adding threads beside it
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_signings,
+            thread_name_prefix="c2pa"
+        )
+    
+    def start(self) -> None:
+        """Make sure the worker pool is running, e.g. in a later app lifespan"""
+        if self._pool is None:
+            self._pool = self._new_pool()
+    
+    def shutdown(self) -> None:
+        """
+        Wait for in-flight signing work and stop the worker threads
+
+        This blocks until queued jobs finish, so call it from a worker thread
+        rather than the event loop.
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
     
     def generate_manifest(
         self,
@@ -40,9 +195,9 @@ class C2PAService:
         ai_tool: str,
         title: Optional[str] = None,
         description: Optional[str] = None
-    ) -> str:
+    ) -> Dict[str, any]:
         """
-        Generate a C2PA manifest file with embedded signer configuration
+        Generate a C2PA manifest definition
         
         Args:
             organization: Organization name
@@ -51,22 +206,15 @@ class C2PAService:
             description: Optional video description
             
         Returns:
-            Path to the generated manifest file
+            Manifest definition as a dictionary
         """
         
-        # Get relative paths for certificates (c2patool prefers relative paths)
-        cert_dir = Path(self.cert_path).parent
-        cert_name = Path(self.cert_path).name
-        key_name = Path(self.private_key_path).name
-        
-        # Build the manifest structure with signer info
+        # Build the manifest structure
         manifest = {
-            "alg": "es256",
-            "private_key": key_name,
-            "sign_cert": cert_name,
-            "ta_url": "http://timestamp.digicert.com",
-            "claim_generator": f"{settings.APP_NAME}/{settings.APP_VERSION}",
-            "title": title if title else "AI Generated Content Credentials",
+            "claim_generator_info": [
+                {"name": settings.APP_NAME, "version": settings.APP_VERSION}
+            ],
+            "title": title if title else self.DEFAULT_TITLE,
             "assertions": [
                 {
                     "label": "c2pa.actions",
@@ -75,7 +223,8 @@ class C2PAService:
                             {
                                 "action": "c2pa.created",
                                 "softwareAgent": ai_tool,
-                                "when": datetime.utcnow().isoformat() + "Z"
+                                "digitalSourceType": self.DIGITAL_SOURCE_TYPE,
+                                "when": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
                             }
                         ]
                     }
@@ -85,7 +234,7 @@ class C2PAService:
                     "data": {
                         "creator": [organization],
                         "creditLine": organization,
-                        "digitalSourceType": "http://cv.iptc.org/newscodes/digitalsourcetype/trainedAlgorithmicMedia"
+                        "digitalSourceType": self.DIGITAL_SOURCE_TYPE
                     }
                 }
             ]
@@ -96,115 +245,285 @@ class C2PAService:
         if description:
             iptc_data["caption"] = description
         
-        # Generate unique manifest filename in certificates directory
-        manifest_id = str(uuid.uuid4())
-        manifest_path = os.path.join(
-            str(cert_dir), 
-            f"manifest_{manifest_id}.json"
-        )
+        return manifest
+    
+    def _cli_manifest_json(self, manifest: Dict[str, any]) -> str:
+        """
+        Serialize a manifest with embedded signer configuration for c2patool
         
-        # Write manifest to file with proper encoding
-        with open(manifest_path, 'w', encoding='utf-8', newline='\n') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        Args:
+            manifest: Manifest definition from generate_manifest
+            
+        Returns:
+            Compact manifest JSON string
+        """
         
-        print(f"📋 Manifest saved to: {manifest_path}")
+        return orjson.dumps({
+            **self._cli_signer_fields,
+            "claim_generator": self.CLAIM_GENERATOR,
+            **manifest
+        }).decode()
+    
+    async def _run_c2patool(
+        self,
+        cmd: list,
+        timeout: float,
+        cwd: Optional[str] = None,
+        stdout_path: Optional[str] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run c2patool without blocking the event loop
         
-        return manifest_path
+        Args:
+            cmd: Full command line, starting with the c2patool path
+            timeout: Seconds to wait before killing the process
+            cwd: Optional working directory
+            stdout_path: Optional file that receives stdout directly, so large
+                output never passes through Python. It only appears once
+                c2patool exits successfully; failed runs leave nothing behind
+            
+        Returns:
+            CompletedProcess with decoded stdout/stderr, like subprocess.run;
+            stdout is empty when stdout_path is given
+        """
+        
+        stdout_file = None
+        if stdout_path:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(stdout_path) or None,
+                prefix=".",
+                suffix=".tmp"
+            )
+            stdout_file = os.fdopen(fd, 'wb')
+        try:
+            stdout_target = stdout_file if stdout_file else asyncio.subprocess.PIPE
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=stdout_target,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd
+                )
+            except NotImplementedError:
+                # Selector event loops on Windows cannot spawn subprocesses
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._pool,
+                    functools.partial(
+                        subprocess.run, cmd, stdout=stdout_target, stderr=subprocess.PIPE,
+                        timeout=timeout, cwd=cwd
+                    )
+                )
+                stdout, stderr = result.stdout, result.stderr
+            else:
+                try:
+                    stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+                except BaseException as e:
+                    # Timeouts and cancellation (client gone, shutdown) must not
+                    # leave c2patool running
+                    if proc.returncode is None:
+                        proc.kill()
+                        await asyncio.shield(proc.wait())
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise subprocess.TimeoutExpired(cmd, timeout)
+                    raise
+                result = proc
+        except BaseException:
+            if stdout_file:
+                stdout_file.close()
+                os.unlink(tmp_path)
+            raise
+        
+        if stdout_file:
+            stdout_file.close()
+            if result.returncode == 0:
+                # mkstemp creates the file owner-only; make it world-readable
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, stdout_path)
+            else:
+                os.unlink(tmp_path)
+        
+        return subprocess.CompletedProcess(
+            cmd,
+            result.returncode,
+            stdout.decode('utf-8', errors='replace') if stdout else "",
+            stderr.decode('utf-8', errors='replace')
+        )
     
-    def sign_video(
+    async def sign_video(
         self,
         input_video_path: str,
         output_video_path: str,
-        manifest_path: str
-    ) -> Dict[str, any]:
+        manifest: Dict[str, any],
+        output_manifest_path: Optional[str] = None
+    ) -> SignResult:
         """
-        Sign video with C2PA credentials using c2patool
+        Sign video with C2PA credentials
         
         Args:
             input_video_path: Path to input video
             output_video_path: Path where signed video will be saved
-            manifest_path: Path to manifest JSON file
+            manifest: Manifest definition from generate_manifest
+            output_manifest_path: Optional path where the manifest JSON will be saved
             
         Returns:
-            Dictionary with success status and details
+            SignResult; manifest_path is set when the manifest JSON was written
         """
         
+        async with self._sign_slots:
+            if self._use_sdk:
+                # The SDK call blocks, so run it off the event loop
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._pool,
+                    functools.partial(
+                        self._sign_with_sdk, input_video_path, output_video_path, manifest, output_manifest_path
+                    )
+                )
+            
+            result = await self._sign_with_cli(input_video_path, output_video_path, manifest)
+            if result.success and output_manifest_path:
+                if await self.extract_manifest(output_video_path, output_manifest_path):
+                    result.manifest_path = output_manifest_path
+            return result
+    
+    def _sign_with_sdk(
+        self,
+        input_video_path: str,
+        output_video_path: str,
+        manifest: Dict[str, any],
+        output_manifest_path: Optional[str] = None
+    ) -> SignResult:
+        """Sign video in-process with the c2pa SDK"""
+        
         try:
-            # Convert to absolute paths
+            with c2pa.Builder(orjson.dumps(manifest).decode()) as builder:
+                manifest_bytes = builder.sign_file(input_video_path, output_video_path, self._signer)
+            
+            # Verify output file was created and is not empty
+            _check_signed_output(output_video_path)
+            
+            result = SignResult(
+                success=True,
+                output_path=output_video_path,
+                message="Video signed successfully"
+            )
+            
+            # Build the sidecar from the manifest store the builder just
+            # produced, instead of re-reading the whole signed video
+            if output_manifest_path:
+                try:
+                    _write_bytes(output_manifest_path, self._manifest_store_json(manifest_bytes))
+                    result.manifest_path = output_manifest_path
+                except Exception as e:
+                    logger.error("Failed to write manifest: %s", e)
+            
+            return result
+            
+        except c2pa.C2paError as e:
+            logger.error("c2pa error: %s", e)
+            return SignResult(success=False, error=f"c2pa signing failed: {e}")
+        except Exception as e:
+            logger.error("Unexpected error: %s", e)
+            return SignResult(success=False, error=f"Unexpected error: {str(e)}")
+    
+    def _manifest_store_json(self, manifest_bytes: bytes) -> bytes:
+        """
+        Render a signed manifest store (JUMBF bytes) as JSON
+        
+        Args:
+            manifest_bytes: Manifest store returned by Builder.sign_file
+            
+        Returns:
+            Manifest store JSON, UTF-8 encoded
+        """
+        
+        with c2pa.Reader("application/c2pa", io.BytesIO(manifest_bytes)) as reader:
+            store = orjson.loads(reader.json())
+        
+        # Read without its asset, so hash validation results would only
+        # report the missing video
+        for key in ("validation_status", "validation_state", "validation_results"):
+            store.pop(key, None)
+        
+        return orjson.dumps(store, option=orjson.OPT_INDENT_2)
+    
+    async def _sign_with_cli(
+        self,
+        input_video_path: str,
+        output_video_path: str,
+        manifest: Dict[str, any]
+    ) -> SignResult:
+        """Sign video by shelling out to c2patool"""
+        
+        try:
+            # c2patool runs from the certificates directory, so paths must be
+            # absolute; the API already passes absolute paths, which skips getcwd()
             abs_input = os.path.abspath(input_video_path)
             abs_output = os.path.abspath(output_video_path)
-            abs_manifest = os.path.abspath(manifest_path)
-            
-            # Get the directory containing the manifest (should be certificates dir)
-            manifest_dir = str(Path(abs_manifest).parent)
             
-            # Build c2patool command - use --manifest flag with file path
+            # Build c2patool command - pass the manifest inline with --config
             cmd = [
-                "c2patool",
+                self._c2patool,
                 abs_input,
-                "--manifest", abs_manifest,
+                "--config", self._cli_manifest_json(manifest),
                 "--output", abs_output,
                 "--force"
             ]
             
-            print(f"🔧 Input: {abs_input}")
-            print(f"🔧 Output: {abs_output}")
-            print(f"🔧 Manifest: {abs_manifest}")
-            print(f"🔧 Working directory: {manifest_dir}")
-            print(f"🔧 Command: {' '.join(cmd)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Input: %s", abs_input)
+                logger.debug("Output: %s", abs_output)
+                logger.debug("Working directory: %s", self._cert_dir)
+                logger.debug("Command: %s", ' '.join(cmd))
             
             # Execute c2patool from the certificates directory
-            result = subprocess.run(
+            result = await self._run_c2patool(
                 cmd,
-                capture_output=True,
-                text=True,
-                check=True,
                 timeout=300,  # 5 minute timeout
-                cwd=manifest_dir  # Run from certificates directory
+                cwd=self._cert_dir  # Run from certificates directory
             )
+            result.check_returncode()
             
-            # Verify output file was created
-            if not os.path.exists(output_video_path):
-                raise Exception("Signed video file was not created")
+            # Verify output file was created and is not empty
+            _check_signed_output(output_video_path)
             
-            # Check file size
-            if os.path.getsize(output_video_path) == 0:
-                raise Exception("Signed video file is empty")
+            logger.debug("c2patool stdout: %s", result.stdout)
             
-            print(f"✅ c2patool stdout: {result.stdout}")
-            
-            return {
-                "success": True,
-                "output_path": output_video_path,
-                "message": "Video signed successfully",
-                "stdout": result.stdout,
-                "stderr": result.stderr
-            }
+            return SignResult(
+                success=True,
+                output_path=output_video_path,
+                message="Video signed successfully",
+                stdout=result.stdout,
+                stderr=result.stderr
+            )
             
         except subprocess.CalledProcessError as e:
             error_msg = f"c2patool failed: {e.stderr if e.stderr else str(e)}"
-            print(f"❌ c2patool error: {error_msg}")
-            print(f"❌ stdout: {e.stdout if hasattr(e, 'stdout') else 'N/A'}")
-            print(f"❌ stderr: {e.stderr if hasattr(e, 'stderr') else 'N/A'}")
-            return {
-                "success": False,
-                "error": error_msg,
-                "stdout": e.stdout if hasattr(e, 'stdout') else "",
-                "stderr": e.stderr if hasattr(e, 'stderr') else ""
-            }
+            logger.error("c2patool error: %s", error_msg)
+            logger.debug("c2patool stdout: %s", e.stdout)
+            logger.debug("c2patool stderr: %s", e.stderr)
+            return SignResult(
+                success=False,
+                error=error_msg,
+                stdout=e.stdout or "",
+                stderr=e.stderr or ""
+            )
         except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "error": "Signing operation timed out (exceeded 5 minutes)"
-            }
+            return SignResult(success=False, error="Signing operation timed out (exceeded 5 minutes)")
         except Exception as e:
-            print(f"❌ Unexpected error: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Unexpected error: {str(e)}"
-            }
+            logger.error("Unexpected error: %s", e)
+            return SignResult(success=False, error=f"Unexpected error: {str(e)}")
     
-    def extract_manifest(
+    def _extract_with_sdk(self, video_path: str, output_json_path: str) -> bool:
+        """Write the manifest store of a signed video as JSON using the c2pa SDK"""
+        
+        with c2pa.Reader(video_path) as reader:
+            manifest_json = reader.json()
+        
+        _write_bytes(output_json_path, manifest_json.encode('utf-8'))
+        
+        return True
+    
+    async def extract_manifest(
         self, 
         video_path: str, 
         output_json_path: str
@@ -221,60 +540,60 @@ class C2PAService:
         """
         
         try:
-            # Convert to absolute paths
+            if self._use_sdk:
+                # Runs in this process, so relative paths resolve as given
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._pool,
+                    functools.partial(self._extract_with_sdk, video_path, output_json_path)
+                )
+            
+            # Convert to absolute paths; a no-op for the absolute paths the API passes
             abs_video_path = os.path.abspath(video_path)
             abs_output_path = os.path.abspath(output_json_path)
             
             # Use c2patool to extract manifest in JSON format
             cmd = [
-                "c2patool",
+                self._c2patool,
                 abs_video_path,
                 "--info",
                 "--output", abs_output_path,
                 "--force"
             ]
             
-            print(f"🔧 Extracting manifest from: {abs_video_path}")
-            print(f"🔧 Output to: {abs_output_path}")
-            print(f"🔧 Command: {' '.join(cmd)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Extracting manifest from: %s", abs_video_path)
+                logger.debug("Output to: %s", abs_output_path)
+                logger.debug("Command: %s", ' '.join(cmd))
             
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True,
-                timeout=60
-            )
+            result = await self._run_c2patool(cmd, timeout=60)
             
             # If --info --output doesn't work, try alternate method
             if result.returncode != 0 or not os.path.exists(output_json_path):
-                print(f"⚠️  First method failed, trying alternate extraction...")
+                logger.warning("First extraction method failed, trying alternate extraction")
                 
-                # Method 2: Get manifest as stdout and save it
-                cmd2 = ["c2patool", abs_video_path, "--info"]
-                result2 = subprocess.run(
-                    cmd2,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=60
-                )
-                
-                # Save stdout to file
-                with open(abs_output_path, 'w', encoding='utf-8') as f:
-                    f.write(result2.stdout)
+                # Method 2: Send the manifest on stdout straight into the file
+                cmd2 = [self._c2patool, abs_video_path, "--info"]
+                result2 = await self._run_c2patool(cmd2, timeout=60, stdout_path=abs_output_path)
+                result2.check_returncode()
                 
-                print(f"✅ Manifest extracted using alternate method")
+                logger.info("Manifest extracted using alternate method")
             
             return os.path.exists(output_json_path)
             
         except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to extract manifest: {e.stderr if e.stderr else str(e)}")
+            logger.error("Failed to extract manifest: %s", e.stderr if e.stderr else e)
             return False
         except Exception as e:
-            print(f"❌ Failed to extract manifest: {e}")
+            logger.error("Failed to extract manifest: %s", e)
             return False
     
-    def verify_video(self, video_path: str) -> Dict[str, any]:
+    def _read_with_sdk(self, video_path: str) -> str:
+        """Return the manifest store JSON of a video using the c2pa SDK"""
+        
+        with c2pa.Reader(video_path) as reader:
+            return reader.json()
+    
+    async def verify_video(self, video_path: str) -> Dict[str, any]:
         """
         Verify C2PA signature in video
         
@@ -286,14 +605,21 @@ class C2PAService:
         """
         
         try:
-            cmd = ["c2patool", video_path, "--info"]
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                check=True,
-                timeout=60
-            )
+            if self._use_sdk:
+                info = await asyncio.get_running_loop().run_in_executor(
+                    self._pool,
+                    functools.partial(self._read_with_sdk, video_path)
+                )
+                
+                return {
+                    "valid": True,
+                    "info": info,
+                    "message": "Video signature is valid"
+                }
+            
+            cmd = [self._c2patool, video_path, "--info"]
+            result = await self._run_c2patool(cmd, timeout=60)
+            result.check_returncode()
             
             return {
                 "valid": True,
@@ -1,38 +1,74 @@
+from contextlib import asynccontextmanager
+from anyio.to_thread import current_default_thread_limiter, run_sync
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from starlette.formparsers import MultiPartParser
 from app.core.config import settings
+from app.core import logging_config  # configures logging before the service is created
+from app.api import routes
+from app.api.responses import SignedFilesStaticFiles
+from app.core.middleware import AccessLogMiddleware, MaxBodySizeMiddleware, VideoAwareGZipMiddleware
+from app.services.c2pa_service import c2pa_service
+import logging
 import os
+from pathlib import Path
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Keep typical uploads in memory instead of spooling them to a temp file;
+# peak memory grows by up to SPOOL_MAX_MB per concurrent upload
+MultiPartParser.spool_max_size = settings.SPOOL_MAX_MB * 1024 * 1024
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Prepare storage directories once per process, before serving requests,
+    and release the signing service's worker threads on shutdown
+    """
+    # Signing runs on the service's own executor; this pool only carries
+    # blocking file I/O such as upload copies and static file reads
+    current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    c2pa_service.start()
+    
+    for directory in (settings.UPLOAD_DIR, settings.MANIFEST_DIR, os.path.dirname(settings.CERT_PATH)):
+        if not directory:
+            continue
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except PermissionError as e:
+            # Read-only filesystems can still serve from pre-provisioned directories
+            logger.warning("Could not create directory %s: %s", directory, e)
+    
+    # Build the cached OpenAPI schema now rather than on the first
+    # /openapi.json request; routes are all registered by this point
+    if app.openapi_url:
+        app.openapi()
+    
+    yield
+    # Draining the signing jobs blocks, so keep it off the event loop
+    await run_sync(c2pa_service.shutdown)
+
+def _load_description() -> str:
+    """Read the Swagger landing text only when the docs are served"""
+    if not settings.DEBUG:
+        return ""
+    return (Path(__file__).parent / "app" / "docs" / "description.md").read_text(encoding="utf-8")
 
 # Create FastAPI application with full Swagger configuration
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
-    description="""
-    ## C2PA Video Signing Service
-    
-    This service adds **C2PA (Content Credentials)** to AI-generated videos, making them verifiable.
-    
-    ### Features:
-    * 🎥 Upload and sign video files with C2PA credentials
-    * 📝 Embed metadata (creator, AI tool, title, description)
-    * 🔐 Cryptographically signed with X.509 certificates
-    * ✅ Verifiable on [Adobe's Content Authenticity](https://verify.contentauthenticity.org)
-    * 📦 Download signed videos and manifests
-    
-    ### How it works:
-    1. Upload a video file with metadata
-    2. System generates a C2PA manifest
-    3. Video is signed using c2patool
-    4. Download the signed video
-    5. Verify on Adobe's website
-    
-    ### Quick Start:
-    Use the **POST /api/v1/sign-video** endpoint to sign your first video!
-    """,
-    docs_url="/docs",  # Swagger UI
-    redoc_url="/redoc",  # ReDoc alternative UI
-    openapi_url="/openapi.json",  # OpenAPI schema
+    description=_load_description(),
+    # Docs are only served in debug mode; without openapi_url FastAPI never
+    # builds or serializes the schema
+    docs_url="/docs" if settings.DEBUG else None,  # Swagger UI
+    redoc_url="/redoc" if settings.DEBUG else None,  # ReDoc alternative UI
+    openapi_url="/openapi.json" if settings.DEBUG else None,  # OpenAPI schema
     contact={
         "name": "C2PA Video Service",
         "email": "support@example.com",
@@ -43,18 +79,60 @@ app = FastAPI(
     },
 )
 
-# CORS middleware (allow all origins for development)
+# Middleware runs in reverse registration order, so the stack from the
+# outside in is: access log, TrustedHost, CORS, body size limit, GZip,
+# then the routes
+
+# Compress JSON and manifest responses; innermost, so it only sees real
+# response bodies
+app.add_middleware(VideoAwareGZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Reject oversized uploads from Content-Length before the body is read;
+# inside CORS so browsers can read the 413
+app.add_middleware(MaxBodySizeMiddleware)
+
+# CORS middleware; explicit method and header lists let Starlette build
+# its preflight responses once instead of echoing request headers back
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=settings.CORS_ORIGINS,
+    allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
+    allow_methods=settings.CORS_METHODS,
+    allow_headers=settings.CORS_HEADERS,
 )
 
-# Mount static files directory (for serving signed videos)
-if os.path.exists(settings.UPLOAD_DIR):
-    app.mount("/files", StaticFiles(directory=settings.UPLOAD_DIR), name="files")
+# Outermost: requests with an unexpected Host header are rejected before
+# any other work
+app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.ALLOWED_HOSTS)
+
+# Wraps everything, so rejected requests are timed and logged too
+app.add_middleware(AccessLogMiddleware)
+
+# Mount static files directory (for serving signed videos); the directory
+# itself is created in lifespan, before the first request. In production
+# nginx serves /files/ straight from UPLOAD_DIR with sendfile instead.
+if not settings.PRODUCTION:
+    app.mount("/files", SignedFilesStaticFiles(directory=settings.UPLOAD_DIR, check_dir=False), name="files")
+
+# Root and health bodies never change at runtime, so encode them once;
+# health probes then skip response validation and JSON encoding entirely
+_ROOT_BODY = orjson.dumps({
+    "service": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "status": "running",
+    "docs": app.docs_url,
+    "redoc": app.redoc_url,
+    "endpoints": {
+        "sign_video": "/api/v1/sign-video",
+        "health": "/api/v1/health"
+    }
+})
+
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+})
 
 # Root endpoint
 @app.get("/", tags=["Health"])
@@ -62,38 +140,41 @@ async def root():
     """
     Root endpoint - Service information
     """
-    return {
-        "service": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "status": "running",
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "endpoints": {
-            "sign_video": "/api/v1/sign-video",
-            "health": "/api/v1/health"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/api/v1/health", tags=["Health"])
 async def health_check():
     """
     Health check endpoint - Verify service is operational
     """
-    return {
-        "status": "healthy",
-        "service": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
-# Import and include routers (we'll create this next)
-from app.api import routes
+# Include API routers
 app.include_router(routes.router, prefix="/api/v1", tags=["C2PA Signing"])
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
+    # reload and multiple workers are mutually exclusive: debug runs one
+    # reloading process, production forks WORKERS processes
+    workers = 1 if settings.DEBUG else settings.WORKERS
     uvicorn.run(
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        workers=workers,
+        backlog=4096,
+        # Back-to-back downloads reuse the connection instead of reconnecting
+        timeout_keep_alive=settings.TIMEOUT_KEEP_ALIVE,
+        # Sheds load with 503s instead of queueing without bound
+        limit_concurrency=settings.LIMIT_CONCURRENCY,
+        # Only the multi-worker supervisor restarts a recycled worker; a
+        # single process would just exit
+        limit_max_requests=settings.LIMIT_MAX_REQUESTS if workers > 1 else None,
+        # AccessLogMiddleware writes the access log instead
+        access_log=False,
+        # uvloop has no Windows build; elsewhere fail loudly if it is missing
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
\ No newline at end of file
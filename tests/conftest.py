@@ -0,0 +1,36 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Settings are read once at import, so configure them before the app loads
+UPLOAD_DIR = tempfile.mkdtemp(prefix="c2pa-test-files-")
+MANIFEST_DIR = tempfile.mkdtemp(prefix="c2pa-test-manifests-")
+os.environ["UPLOAD_DIR"] = UPLOAD_DIR
+os.environ["MANIFEST_DIR"] = MANIFEST_DIR
+os.environ["MAX_FILE_SIZE_MB"] = "1"
+os.environ["ACCEL_REDIRECT_PREFIX"] = ""
+os.environ.setdefault("TIMESTAMP_URL", "")
+os.environ.setdefault("CERT_PATH", str(REPO_ROOT / "certificates" / "sign-cert.pem"))
+os.environ.setdefault("PRIVATE_KEY_PATH", str(REPO_ROOT / "certificates" / "sign-key.pem"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+    shutil.rmtree(UPLOAD_DIR, ignore_errors=True)
+    shutil.rmtree(MANIFEST_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def upload_dir():
+    return Path(UPLOAD_DIR)
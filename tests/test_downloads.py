@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from app.api.responses import IMMUTABLE_CACHE_CONTROL, AccelRedirectResponse
+from app.core.static_cache import static_file_cache
+
+VIDEO_BYTES = os.urandom(64 * 1024)
+MANIFEST_BYTES = b'{"active_manifest": "urn:c2pa:test", "manifests": {}}' * 50
+
+
+@pytest.fixture
+def signed_files(upload_dir):
+    video = upload_dir / "clip-signed.mp4"
+    manifest = upload_dir / "clip-signed.manifest.json"
+    video.write_bytes(VIDEO_BYTES)
+    manifest.write_bytes(MANIFEST_BYTES)
+    yield video, manifest
+    video.unlink()
+    manifest.unlink()
+
+
+def test_download_streams_the_file(client, signed_files):
+    response = client.get("/api/v1/files/clip-signed.mp4")
+
+    assert response.status_code == 200
+    assert response.content == VIDEO_BYTES
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["content-disposition"] == 'attachment; filename="clip-signed.mp4"'
+
+
+def test_download_rejects_path_separators(client):
+    response = client.get("/api/v1/files/..%5Csecret.mp4")
+
+    assert response.status_code == 400
+
+
+def test_download_rejects_parent_directory(client):
+    response = client.get("/api/v1/files/%2E%2E")
+
+    assert response.status_code == 403
+
+
+def test_download_rejects_symlink_escape(client, upload_dir, tmp_path):
+    outside = tmp_path / "outside.mp4"
+    outside.write_bytes(b"private")
+    link = upload_dir / "escape.mp4"
+    try:
+        link.symlink_to(outside)
+    except OSError:
+        pytest.skip("symlinks are not available")
+
+    try:
+        response = client.get("/api/v1/files/escape.mp4")
+    finally:
+        link.unlink()
+
+    assert response.status_code == 403
+
+
+def test_download_missing_file(client):
+    response = client.get("/api/v1/files/missing.mp4")
+
+    assert response.status_code == 404
+
+
+def test_accel_redirect_keeps_the_cache_headers():
+    response = AccelRedirectResponse("/_protected_files/", "clip signed.mp4")
+
+    assert response.headers["x-accel-redirect"] == "/_protected_files/clip%20signed.mp4"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.body == b""
+
+
+def test_static_small_file_is_cached(client, signed_files):
+    _, manifest = signed_files
+
+    response = client.get("/files/clip-signed.manifest.json")
+
+    assert response.status_code == 200
+    assert response.content == MANIFEST_BYTES
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert static_file_cache.peek(str(manifest), manifest.stat()) == MANIFEST_BYTES
+
+
+def test_static_range_request_gets_partial_content(client, signed_files):
+    response = client.get("/files/clip-signed.manifest.json", headers={"Range": "bytes=0-9"})
+
+    assert response.status_code == 206
+    assert response.content == MANIFEST_BYTES[:10]
+    assert response.headers["content-range"] == f"bytes 0-9/{len(MANIFEST_BYTES)}"
+
+
+def test_static_conditional_get_is_not_modified(client, signed_files):
+    etag = client.get("/files/clip-signed.mp4").headers["etag"]
+
+    response = client.get("/files/clip-signed.mp4", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+
+def test_video_responses_are_not_compressed(client, signed_files):
+    for url in ("/files/clip-signed.mp4", "/api/v1/files/clip-signed.mp4"):
+        response = client.get(url, headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.content == VIDEO_BYTES
+
+
+def test_manifest_responses_are_compressed(client, signed_files):
+    response = client.get("/files/clip-signed.manifest.json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == MANIFEST_BYTES
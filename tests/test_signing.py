@@ -0,0 +1,61 @@
+import struct
+
+import orjson
+
+from app.core.config import settings
+
+SIGN_URL = "/api/v1/sign-video"
+
+
+def _box(kind, payload=b""):
+    return struct.pack(">I", 8 + len(payload)) + kind + payload
+
+
+def _tiny_mp4():
+    """Smallest MP4 the c2pa SDK will sign: ftyp, a moov with an mvhd, mdat"""
+    ftyp = _box(b"ftyp", b"isom" + struct.pack(">I", 0x200) + b"isomiso2mp41")
+    mvhd = _box(
+        b"mvhd",
+        bytes(4)
+        + struct.pack(">IIII", 0, 0, 1000, 0)
+        + struct.pack(">IH", 0x10000, 0x100)
+        + bytes(10)
+        + struct.pack(">9I", 0x10000, 0, 0, 0, 0x10000, 0, 0, 0, 0x40000000)
+        + bytes(24)
+        + struct.pack(">I", 2)
+    )
+    return ftyp + _box(b"moov", mvhd) + _box(b"mdat", bytes(64))
+
+
+def _files_path(url):
+    return url.split("/files/", 1)[1]
+
+
+def test_sign_video_end_to_end(client, upload_dir):
+    video = _tiny_mp4()
+
+    response = client.post(
+        SIGN_URL,
+        files={"video": ("clip.mp4", video, "video/mp4")},
+        data={"organization": "Test Org", "ai_tool": "Test Tool", "title": "Clip"},
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["status"] == "ok"
+    assert body["metadata"]["organization"] == "Test Org"
+    assert not list(upload_dir.glob("temp_*"))
+
+    signed_name = _files_path(body["links"]["download_url"])
+    signed = client.get(f"/api/v1/files/{signed_name}")
+    assert signed.status_code == 200
+    assert signed.content.startswith(video[:8])
+    assert b"c2pa" in signed.content
+
+    manifest_name = _files_path(body["links"]["manifest_url"])
+    sidecar = client.get(f"/api/v1/files/{manifest_name}")
+    assert sidecar.status_code == 200
+    store = orjson.loads(sidecar.content)
+    active = store["manifests"][store["active_manifest"]]
+    assert active["title"] == "Clip"
+    assert active["claim_generator_info"][0]["name"] == settings.APP_NAME
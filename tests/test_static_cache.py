@@ -0,0 +1,53 @@
+import os
+
+from app.core.static_cache import StaticFileCache
+
+
+def _write(path, data):
+    path.write_bytes(data)
+    return path, path.stat()
+
+
+def test_hit_is_served_from_memory(tmp_path):
+    cache = StaticFileCache(max_bytes=1024)
+    path, stat = _write(tmp_path / "a.json", b"first")
+
+    assert cache.peek(str(path), stat) is None
+    assert cache.get(str(path), stat) == b"first"
+
+    path.unlink()
+    assert cache.get(str(path), stat) == b"first"
+
+
+def test_rewritten_file_is_read_again(tmp_path):
+    cache = StaticFileCache(max_bytes=1024)
+    path, stat = _write(tmp_path / "a.json", b"first")
+    cache.get(str(path), stat)
+
+    path, stat = _write(path, b"second version")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert cache.get(str(path), path.stat()) == b"second version"
+
+
+def test_large_files_are_not_cached(tmp_path):
+    cache = StaticFileCache(max_bytes=1024, max_entry_bytes=8)
+    path, stat = _write(tmp_path / "big.json", b"x" * 9)
+
+    assert not cache.cacheable(stat)
+    assert cache.get(str(path), stat) is None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = StaticFileCache(max_bytes=20)
+    files = [_write(tmp_path / f"{name}.json", b"x" * 8) for name in "abc"]
+
+    a, b, c = [(str(path), stat) for path, stat in files]
+    cache.get(*a)
+    cache.get(*b)
+    cache.get(*a)
+    cache.get(*c)
+
+    assert cache.peek(*a) is not None
+    assert cache.peek(*b) is None
+    assert cache.peek(*c) is not None
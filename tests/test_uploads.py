@@ -0,0 +1,109 @@
+import os
+import tempfile
+
+import pytest
+
+from app.api.routes import UPLOAD_CHUNK_SIZE, _copy_upload
+from app.core.middleware import MULTIPART_OVERHEAD_BYTES
+
+SIGN_URL = "/api/v1/sign-video"
+MULTIPART = {"Content-Type": "multipart/form-data; boundary=test-boundary"}
+
+# Just past MAX_FILE_SIZE_MB=1 plus the multipart headroom
+OVERSIZED = 1024 * 1024 + MULTIPART_OVERHEAD_BYTES + 1
+
+UPLOAD_BYTES = os.urandom(UPLOAD_CHUNK_SIZE * 2 + 12345)
+
+
+def _spooled(data, max_size):
+    # The same kind of file Starlette hands to UploadFile
+    source = tempfile.SpooledTemporaryFile(max_size=max_size)
+    source.write(data)
+    source.seek(0)
+    return source
+
+
+def test_declared_content_length_over_limit_is_rejected(client):
+    response = client.post(SIGN_URL, content=b"x" * OVERSIZED, headers=MULTIPART)
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": "File too large. Maximum size: 1MB"}
+
+
+def test_chunked_body_over_limit_is_rejected(client):
+    def body():
+        sent = 0
+        while sent < OVERSIZED:
+            yield b"x" * 64 * 1024
+            sent += 64 * 1024
+
+    # A generator body goes out chunked, without a Content-Length header
+    response = client.post(SIGN_URL, content=body(), headers=MULTIPART)
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": "File too large. Maximum size: 1MB"}
+
+
+def test_upload_with_unsupported_extension_is_rejected(client):
+    response = client.post(
+        SIGN_URL,
+        files={"video": ("clip.avi", b"not a video", "video/x-msvideo")},
+        data={"organization": "Test Org", "ai_tool": "Test Tool"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_copy_buffered(tmp_path, monkeypatch):
+    # Without copy_file_range, spooled files go through the readinto loop
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    source = _spooled(UPLOAD_BYTES, max_size=1024)
+    dest = tmp_path / "upload.mp4"
+
+    assert _copy_upload(source, str(dest), len(UPLOAD_BYTES)) == len(UPLOAD_BYTES)
+    assert dest.read_bytes() == UPLOAD_BYTES
+
+
+def test_copy_buffered_stops_past_the_limit(tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    source = _spooled(UPLOAD_BYTES, max_size=1024)
+
+    copied = _copy_upload(source, str(tmp_path / "upload.mp4"), UPLOAD_CHUNK_SIZE)
+
+    assert UPLOAD_CHUNK_SIZE < copied < len(UPLOAD_BYTES)
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range is Linux only")
+def test_copy_spooled_to_disk_in_kernel(tmp_path):
+    source = _spooled(UPLOAD_BYTES, max_size=1024)
+    source.read(10)
+    dest = tmp_path / "upload.mp4"
+
+    # Copies from the current position, like the buffered path
+    assert _copy_upload(source, str(dest), len(UPLOAD_BYTES)) == len(UPLOAD_BYTES) - 10
+    assert dest.read_bytes() == UPLOAD_BYTES[10:]
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range is Linux only")
+def test_copy_in_kernel_over_limit_writes_nothing(tmp_path):
+    source = _spooled(UPLOAD_BYTES, max_size=1024)
+    dest = tmp_path / "upload.mp4"
+
+    assert _copy_upload(source, str(dest), len(UPLOAD_BYTES) - 1) == len(UPLOAD_BYTES)
+    assert not dest.exists()
+
+
+def test_copy_held_in_memory(tmp_path):
+    source = _spooled(UPLOAD_BYTES, max_size=len(UPLOAD_BYTES) + 1)
+    dest = tmp_path / "upload.mp4"
+
+    assert _copy_upload(source, str(dest), len(UPLOAD_BYTES)) == len(UPLOAD_BYTES)
+    assert dest.read_bytes() == UPLOAD_BYTES
+
+
+def test_copy_held_in_memory_over_limit_writes_nothing(tmp_path):
+    source = _spooled(UPLOAD_BYTES, max_size=len(UPLOAD_BYTES) + 1)
+    dest = tmp_path / "upload.mp4"
+
+    assert _copy_upload(source, str(dest), len(UPLOAD_BYTES) - 1) == len(UPLOAD_BYTES)
+    assert not dest.exists()